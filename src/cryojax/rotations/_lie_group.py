@@ -111,17 +111,23 @@ class SO3(AbstractMatrixLieGroup, strict=True):
     @classmethod
     def from_x_radians(cls, angle: Float[Array, ""]) -> Self:
         """Generates a x-axis rotation."""
-        return cls.exp(jnp.asarray([angle, 0.0, 0.0]))
+        half_angle = 0.5 * jnp.asarray(angle)
+        zero = jnp.zeros_like(half_angle)
+        return cls(jnp.stack([jnp.cos(half_angle), -jnp.sin(half_angle), zero, zero]))
 
     @classmethod
     def from_y_radians(cls, angle: Float[Array, ""]) -> Self:
-        """Generates a x-axis rotation."""
-        return cls.exp(jnp.asarray([0.0, angle, 0.0]))
+        """Generates a y-axis rotation."""
+        half_angle = 0.5 * jnp.asarray(angle)
+        zero = jnp.zeros_like(half_angle)
+        return cls(jnp.stack([jnp.cos(half_angle), zero, -jnp.sin(half_angle), zero]))
 
     @classmethod
     def from_z_radians(cls, angle: Float[Array, ""]) -> Self:
-        """Generates a x-axis rotation."""
-        return cls.exp(jnp.asarray([0.0, 0.0, angle]))
+        """Generates a z-axis rotation."""
+        half_angle = 0.5 * jnp.asarray(angle)
+        zero = jnp.zeros_like(half_angle)
+        return cls(jnp.stack([jnp.cos(half_angle), zero, zero, -jnp.sin(half_angle)]))
 
     @override
     @classmethod
@@ -209,14 +215,19 @@ class SO3(AbstractMatrixLieGroup, strict=True):
 
     @override
     def as_matrix(self) -> Float[Array, "3 3"]:
-        norm = self.wxyz @ self.wxyz
-        q = self.wxyz * jnp.sqrt(2.0 / norm)
-        q = jnp.outer(q, q)
+        # Compute only the nine distinct quadratic terms, scaled by 2 / |q|^2
+        # so that the quaternion need not be normalized
+        w, x, y, z = self.wxyz
+        scale = 2.0 / (self.wxyz @ self.wxyz)
+        xs, ys, zs = x * scale, y * scale, z * scale
+        wx, wy, wz = w * xs, w * ys, w * zs
+        xx, xy, xz = x * xs, x * ys, x * zs
+        yy, yz, zz = y * ys, y * zs, z * zs
         return jnp.array(
             [
-                [1.0 - q[2, 2] - q[3, 3], q[1, 2] - q[3, 0], q[1, 3] + q[2, 0]],
-                [q[1, 2] + q[3, 0], 1.0 - q[1, 1] - q[3, 3], q[2, 3] - q[1, 0]],
-                [q[1, 3] - q[2, 0], q[2, 3] + q[1, 0], 1.0 - q[1, 1] - q[2, 2]],
+                [1.0 - yy - zz, xy - wz, xz + wy],
+                [xy + wz, 1.0 - xx - zz, yz - wx],
+                [xz - wy, yz + wx, 1.0 - xx - yy],
             ]
         )
 
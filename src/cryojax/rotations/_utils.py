@@ -22,24 +22,24 @@ def convert_quaternion_to_euler_angles(
         )
     xyz_axis_to_array_axis = {"x": 0, "y": 1, "z": 2}
     axes = [xyz_axis_to_array_axis[axis] for axis in convention]
-    xyzw = jnp.roll(wxyz, shift=-1)
+    w, xyz = wxyz[0], wxyz[1:]
     angle_first, angle_third = (0, 2)
     i, j, k = axes
     eps = 1e-7
     symmetric = i == k
     if symmetric:
         k = 3 - i - j
-        sign = -jnp.array((i - j) * (j - k) * (k - i) // 2, dtype=xyzw.dtype)
-        a, b, c, d = (xyzw[3], -xyzw[i], -xyzw[j], -xyzw[k] * sign)
+        sign = -jnp.array((i - j) * (j - k) * (k - i) // 2, dtype=wxyz.dtype)
+        a, b, c, d = (w, -xyz[i], -xyz[j], -xyz[k] * sign)
     else:
-        sign = -jnp.array((i - j) * (j - k) * (k - i) // 2, dtype=xyzw.dtype)
+        sign = -jnp.array((i - j) * (j - k) * (k - i) // 2, dtype=wxyz.dtype)
         a, b, c, d = (
-            xyzw[3] + xyzw[j],
-            -xyzw[i] - xyzw[k] * sign,
-            -xyzw[j] + xyzw[3],
-            -xyzw[k] * sign + xyzw[i],
+            w + xyz[j],
+            -xyz[i] - xyz[k] * sign,
+            -xyz[j] + w,
+            -xyz[k] * sign + xyz[i],
         )
-    angles = jnp.empty(3, dtype=xyzw.dtype)
+    angles = jnp.empty(3, dtype=wxyz.dtype)
     angles = angles.at[1].set(2 * jnp.arctan2(jnp.hypot(c, d), jnp.hypot(a, b)))
     case = jnp.where(jnp.abs(angles[1] - jnp.pi) <= eps, 2, 0)
     case = jnp.where(jnp.abs(angles[1]) <= eps, 1, case)
@@ -1,5 +1,6 @@
 from ._assembly import (
     AbstractAssembly as AbstractAssembly,
+    compute_helical_lattice as compute_helical_lattice,
     compute_helical_lattice_positions as compute_helical_lattice_positions,
     compute_helical_lattice_rotations as compute_helical_lattice_rotations,
     HelicalAssembly as HelicalAssembly,
@@ -2,11 +2,12 @@
 Abstraction of a helical polymer.
 """
 
-from functools import cached_property
+from functools import cached_property, partial
 from typing import Optional
 
 import jax
 import jax.numpy as jnp
+from equinox import field
 from jaxtyping import Array, Float
 
 from ...rotations import SO3
@@ -36,8 +37,8 @@ class HelicalAssembly(AbstractAssembly, strict=True):
     pose: AbstractPose
     conformation: Optional[AbstractConformationalVariable]
 
-    n_subunits: int
-    n_start: int
+    n_subunits: int = field(static=True)
+    n_start: int = field(static=True)
 
     def __init__(
         self,
@@ -87,35 +88,117 @@ class HelicalAssembly(AbstractAssembly, strict=True):
             )
 
     @cached_property
-    def offsets_in_angstroms(self) -> Float[Array, "{self.n_subunits} 3"]:
-        """Get the helical lattice positions in the center of mass frame."""
-        return compute_helical_lattice_positions(
+    def _lattice(
+        self,
+    ) -> tuple[Float[Array, "{self.n_subunits} 3"], SO3]:
+        """Get the helical lattice positions and rotations in the center
+        of mass frame.
+        """
+        return _compute_lattice(
             self.rise,
             self.twist,
+            self.subunit.pose.offset_in_angstroms,
+            self.subunit.pose.rotation,
             n_subunits_per_start=self.n_subunits // self.n_start,
-            initial_displacement=self.subunit.pose.offset_in_angstroms,
             n_start=self.n_start,
         )
 
+    @cached_property
+    def offsets_in_angstroms(self) -> Float[Array, "{self.n_subunits} 3"]:
+        """Get the helical lattice positions in the center of mass frame."""
+        subunit_positions, _ = self._lattice
+        return subunit_positions
+
     @cached_property
     def rotations(self) -> SO3:
         """Get the helical lattice rotations in the center of mass frame.
 
         These are rotations of the initial subunit.
         """
-        transformed_rotation_matrices = compute_helical_lattice_rotations(
-            self.twist,
-            n_subunits_per_start=self.n_subunits // self.n_start,
-            initial_rotation=self.subunit.pose.rotation.as_matrix(),
-            n_start=self.n_start,
-        )
-        # Function to construct SO3 objects vmapped over leading dimension
-        transformed_rotations = jax.vmap(lambda mat: SO3.from_matrix(mat))(
-            transformed_rotation_matrices
-        )
-        return transformed_rotations
+        _, subunit_rotations = self._lattice
+        return subunit_rotations
+
+
+@partial(jax.jit, static_argnames=["n_subunits_per_start", "n_start"])
+def _compute_lattice(
+    rise: Float[Array, ""],
+    twist: Float[Array, ""],
+    initial_displacement: Float[Array, "3"],
+    initial_rotation: SO3,
+    n_subunits_per_start: int,
+    n_start: int,
+) -> tuple[Float[Array, "{n_start*n_subunits_per_start} 3"], SO3]:
+    """Compute the lattice positions and `SO3` rotations of a helix under
+    a single jit boundary, so that the conversions to and from rotation
+    matrices are traced together with the lattice itself.
+    """
+    positions, rotation_matrices = compute_helical_lattice(
+        rise,
+        twist,
+        n_subunits_per_start=n_subunits_per_start,
+        initial_displacement=initial_displacement,
+        initial_rotation=initial_rotation.as_matrix(),
+        n_start=n_start,
+    )
+    return positions, jax.vmap(SO3.from_matrix)(rotation_matrices)
+
+
+@partial(jax.jit, static_argnames=["n_subunits_per_start", "n_start"])
+def compute_helical_lattice(
+    rise: Float[Array, ""],
+    twist: Float[Array, ""],
+    n_subunits_per_start: int,
+    initial_displacement: Float[Array, "3"],
+    initial_rotation: Optional[Float[Array, "3 3"]] = None,
+    n_start: int = 1,
+) -> tuple[
+    Float[Array, "{n_start*n_subunits_per_start} 3"],
+    Float[Array, "{n_start*n_subunits_per_start} 3 3"],
+]:
+    """
+    Compute both the lattice points and the relative rotations
+    of subunits on a helical lattice.
+
+    This is equivalent to calling `compute_helical_lattice_positions`
+    and `compute_helical_lattice_rotations`, but the rotations about
+    the screw axis are only evaluated once.
+
+    Arguments
+    ---------
+    rise : `Real_`
+        The helical rise.
+    twist : `Real_`
+        The helical twist.
+    n_subunits_per_start :
+        The number of subunits in the assembly for
+        a single sub-helix. This sets the shape of the
+        output, so it must be a python integer.
+    initial_displacement : `Array`, shape `(3,)`
+        The initial position vector of the first subunit, in
+        the center of mass frame of the helix.
+    initial_rotation : `Array`, shape `(3, 3)`
+        The initial rotation of the first subunit. By default,
+        the identity matrix.
+    n_start :
+        The start number of the helix. This must be a python
+        integer.
+
+    Returns
+    -------
+    subunit_positions : shape `(n_start*n_subunits_per_start, 3)`
+        The helical lattice positions.
+    subunit_rotations : shape `(n_start*n_subunits_per_start, 3, 3)`
+        The relative rotations between subunits
+        on the helical lattice.
+    """
+    c, s = _compute_screw_axis_cos_and_sin(twist, n_subunits_per_start, n_start)
+    subunit_positions = _compute_lattice_positions(c, s, rise, initial_displacement)
+    subunit_rotations = _compute_lattice_rotations(c, s, initial_rotation)
+
+    return subunit_positions, subunit_rotations
 
 
+@partial(jax.jit, static_argnames=["n_subunits_per_start", "n_start"])
 def compute_helical_lattice_positions(
     rise: Float[Array, ""],
     twist: Float[Array, ""],
@@ -135,7 +218,8 @@ def compute_helical_lattice_positions(
         The helical twist.
     n_subunits_per_start :
         The number of subunits in the assembly for
-        a single sub-helix.
+        a single sub-helix. This sets the shape of the
+        output, so it must be a python integer.
     initial_displacement : `Array`, shape `(3,)`
         The initial position vector of the first subunit, in
         the center of mass frame of the helix.
@@ -143,70 +227,23 @@ def compute_helical_lattice_positions(
         the screw axis, and the z value is an offset from the
         first subunit's position.
     n_start :
-        The start number of the helix.
+        The start number of the helix. This must be a python
+        integer.
 
     Returns
     -------
     subunit_positions : shape `(n_start*n_subunits_per_start, 3)`
         The helical lattice positions.
     """
-    # Convert to radians
-    twist = jnp.deg2rad(twist)
-
-    # Coordinate transformation to get subunit positions in a single sub-helix
-    def compute_ith_subunit_position_in_subhelix(i, theta, dz, r_0, N):
-        # ... define rotation about the screw axis
-        c, s = jnp.cos(i * theta), jnp.sin(i * theta)
-        R_t = jnp.array(((c, -s, 0), (s, c, 0), (0, 0, 1)), dtype=float)
-        # ... transform by i rises and i twists
-        r_i = R_t @ r_0 + i * jnp.asarray((0, 0, dz), dtype=float)
-        # ... center positions of subunits in z
-        return r_i - jnp.asarray(
-            (0.0, 0.0, dz * jnp.asarray(N - 1, dtype=float) / 2), dtype=float
-        )
-
-    # ... function to get positions of all subunits
-    compute_subunit_positions_in_subhelix = jax.vmap(
-        compute_ith_subunit_position_in_subhelix,
-        in_axes=[0, None, None, None, None],
-    )
-    # ... get indices of subunits along sub-helix
-    subunit_indices = jnp.arange(n_subunits_per_start, dtype=float)
-    # ... compute positions of subunits in sub-helix
-    subunit_positions_in_subhelix = compute_subunit_positions_in_subhelix(
-        subunit_indices,
-        twist,
-        rise,
-        initial_displacement,
-        n_subunits_per_start,
-    )
-
-    # Now, transform this single sub-helix into all sub-helices, related by C_n
-    # symmetry
-    def compute_helix_subunit_positions_per_start(symmetry_angle, r):
-        # ... rotate the sub-helix around the screw axis to a different sub-helix
-        c_n, s_n = jnp.cos(symmetry_angle), jnp.sin(symmetry_angle)
-        R_n = jnp.array(((c_n, -s_n, 0), (s_n, c_n, 0), (0, 0, 1)), dtype=float)
-        return (R_n @ r.T).T
-
-    # ... function to rotate entire sub-helix around the screw axis
-    compute_helix_subunit_positions = jax.vmap(
-        compute_helix_subunit_positions_per_start, in_axes=[0, None]
-    )
-    # ... compute symmetry angles relating first sub-helix to all other sub-helices
-    symmetry_angles = jnp.array([2 * jnp.pi * n / n_start for n in range(n_start)])
-    # ... finally, get all subunit positions!
-    subunit_positions = compute_helix_subunit_positions(
-        symmetry_angles, subunit_positions_in_subhelix
-    ).reshape((n_start * n_subunits_per_start, 3))
-
-    return subunit_positions
+    c, s = _compute_screw_axis_cos_and_sin(twist, n_subunits_per_start, n_start)
+    return _compute_lattice_positions(c, s, rise, initial_displacement)
 
 
+@partial(jax.jit, static_argnames=["n_subunits_per_start", "n_start"])
 def compute_helical_lattice_rotations(
     twist: Float[Array, ""],
     n_subunits_per_start: int,
-    initial_rotation: Float[Array, "3 3"] = jnp.eye(3),
+    initial_rotation: Optional[Float[Array, "3 3"]] = None,
     n_start: int = 1,
 ) -> Float[Array, "{n_start*n_subunits_per_start} 3 3"]:
     """
@@ -220,12 +257,14 @@ def compute_helical_lattice_rotations(
         The helical twist.
     n_subunits_per_start :
         The number of subunits in the assembly for
-        a single sub-helix.
+        a single sub-helix. This sets the shape of the
+        output, so it must be a python integer.
     initial_rotation : `Array`, shape `(3, 3)`
         The initial rotation of the first subunit. By default,
         the identity matrix.
     n_start :
-        The start number of the helix.
+        The start number of the helix. This must be a python
+        integer.
 
     Returns
     -------
@@ -233,45 +272,63 @@ def compute_helical_lattice_rotations(
         The relative rotations between subunits
         on the helical lattice.
     """
+    c, s = _compute_screw_axis_cos_and_sin(twist, n_subunits_per_start, n_start)
+    return _compute_lattice_rotations(c, s, initial_rotation)
+
+
+def _compute_screw_axis_cos_and_sin(twist, n_subunits_per_start, n_start):
     # Convert to radians
-    twist = jnp.deg2rad(twist)
-
-    # Coordinate transformation to get subunit rotations in a single sub-helix
-    def compute_ith_subunit_rotation_in_subhelix(i, theta, R_0):
-        # ... define rotation about the screw axis
-        c, s = jnp.cos(i * theta), jnp.sin(i * theta)
-        R_t = jnp.array(((c, -s, 0), (s, c, 0), (0, 0, 1)), dtype=float)
-        # ... transform to the ith position
-        return R_t @ R_0
-
-    # ... function to get rotations of all subunits
-    compute_subunit_rotations_in_subhelix = jax.vmap(
-        compute_ith_subunit_rotation_in_subhelix, in_axes=[0, None, None]
-    )
+    twist_in_radians = jnp.deg2rad(twist)
+    # ... compute in the precision of the twist
+    dtype = twist_in_radians.dtype
+    # ... compute symmetry angles relating first sub-helix to all other sub-helices
+    symmetry_angles = (2 * jnp.pi / n_start) * jnp.arange(n_start, dtype=dtype)
     # ... get indices of subunits along sub-helix
-    subunit_indices = jnp.arange(n_subunits_per_start, dtype=float)
-    # ... compute rotations of subunits in sub-helix
-    subunit_rotations_in_subhelix = compute_subunit_rotations_in_subhelix(
-        subunit_indices, twist, initial_rotation
+    subunit_indices = jnp.arange(n_subunits_per_start, dtype=dtype)
+    # Rotations about the screw axis compose by adding angles, so the ith subunit
+    # on the nth sub-helix is rotated by i twists plus the nth symmetry angle.
+    # Evaluate all angles at once with shape (n_start, n_subunits_per_start)
+    angles = subunit_indices[None, :] * twist_in_radians + symmetry_angles[:, None]
+    return jnp.cos(angles), jnp.sin(angles)
+
+
+def _compute_lattice_positions(c, s, rise, initial_displacement):
+    n_subunits_per_start = c.shape[1]
+    x_0, y_0, z_0 = initial_displacement
+    # ... rotate the initial displacement about the screw axis
+    x = c * x_0 - s * y_0
+    y = s * x_0 + c * y_0
+    # ... transform by i rises and center positions of subunits in z
+    subunit_indices = jnp.arange(n_subunits_per_start, dtype=c.dtype)
+    z = jnp.broadcast_to(
+        z_0 + rise * (subunit_indices - (n_subunits_per_start - 1) / 2), c.shape
     )
+    # ... finally, get all subunit positions!
+    return jnp.stack((x, y, z), axis=-1).reshape(-1, 3)
 
-    # Now, transform single sub-helix rotations into all sub-helices rotations,
-    # related by C_n symmetry
-    def compute_helix_subunit_rotations_per_start(symmetry_angle, R):
-        # ... rotate the sub-helix around the screw axis to a different sub-helix
-        c_n, s_n = jnp.cos(symmetry_angle), jnp.sin(symmetry_angle)
-        R_n = jnp.array(((c_n, -s_n, 0), (s_n, c_n, 0), (0, 0, 1)), dtype=float)
-        return jnp.einsum("ij,njk->nik", R_n, R)
-
-    # ... function to rotate subunit about symmetry angle
-    compute_helix_subunit_rotations = jax.vmap(
-        compute_helix_subunit_rotations_per_start, in_axes=[0, None]
-    )
-    # ... compute symmetry angles relating first sub-helix to all other sub-helices
-    symmetry_angles = jnp.array([2 * jnp.pi * n / n_start for n in range(n_start)])
-    # ... finally, get all subunit rotations!
-    subunit_rotations = compute_helix_subunit_rotations(
-        symmetry_angles, subunit_rotations_in_subhelix
-    ).reshape((n_start * n_subunits_per_start, 3, 3))
 
-    return subunit_rotations
+def _compute_lattice_rotations(c, s, initial_rotation):
+    if initial_rotation is None:
+        # ... default to the identity, in the precision of the lattice so that
+        # the rotations are not promoted
+        initial_rotation = jnp.eye(3, dtype=c.dtype)
+    # ... build all rotations about the screw axis, with shape
+    # (n_start, n_subunits_per_start, 3, 3)
+    R_t = _make_z_rotation_matrices(c, s)
+    # ... finally, get all subunit rotations!
+    return (R_t @ initial_rotation).reshape(-1, 3, 3)
+
+
+def _make_z_rotation_matrices(
+    c: Float[Array, "..."], s: Float[Array, "..."]
+) -> Float[Array, "... 3 3"]:
+    # Build rotation matrices about the z-axis from tables of cosines and sines
+    zeros, ones = jnp.zeros_like(c), jnp.ones_like(c)
+    return jnp.stack(
+        (
+            jnp.stack((c, -s, zeros), axis=-1),
+            jnp.stack((s, c, zeros), axis=-1),
+            jnp.stack((zeros, zeros, ones), axis=-1),
+        ),
+        axis=-2,
+    )
@@ -6,6 +6,7 @@ from abc import abstractmethod
 from typing import Optional
 from typing_extensions import override
 
+import equinox as eqx
 import jax
 from equinox import AbstractVar, Module
 from jaxtyping import Array, Complex, Float, PRNGKeyArray
@@ -62,6 +63,10 @@ class AbstractImagingPipeline(Module, strict=True):
                           are not applied. Instead, an image at the shape
                           `Instrument.padded_shape` is returned.
         - `get_real`: If `True`, return the image in real space.
+
+        Concrete implementations of `render` are compiled with `equinox.filter_jit`,
+        so `postprocess`, `get_real`, and the image shapes in the
+        `InstrumentConfig` are treated as static.
         """
         raise NotImplementedError
 
@@ -85,39 +90,35 @@ class AbstractImagingPipeline(Module, strict=True):
         in either real or fourier space.
         """
         instrument_config = self.instrument_config
-        if (
-            self.mask is None
-            and instrument_config.padded_shape == instrument_config.shape
+        is_crop_required = instrument_config.padded_shape != instrument_config.shape
+        # First, apply the filter in fourier space if it is the same size as the
+        # padded image. If no cropping is required, this is always the case
+        is_filter_applied = self.filter is None
+        if self.filter is not None and (
+            not is_crop_required
+            or self.filter.array.shape
+            == (instrument_config.padded_y_dim, instrument_config.padded_x_dim // 2 + 1)
         ):
-            # ... if there are no masks and we don't need to crop,
-            # minimize moving back and forth between real and fourier space
-            if self.filter is not None:
-                image = self.filter(image)
+            image = self.filter(image)
+            is_filter_applied = True
+        if not is_crop_required and self.mask is None:
+            # ... if there are no masks and we don't need to crop, there is no
+            # need to move back and forth between real and fourier space
             return irfftn(image, s=instrument_config.shape) if get_real else image
+        # Next, crop and mask in real space
+        image = instrument_config.crop_to_shape(
+            irfftn(image, s=instrument_config.padded_shape)
+        )
+        if self.mask is not None:
+            image = self.mask(image)
+        # Finally, only go back to fourier space if necessary. Any transform
+        # back to fourier space is of the cropped image
+        if is_filter_applied or self.filter is None:
+            return image if get_real else rfftn(image)
         else:
-            # ... otherwise, apply filter, crop, and mask, again trying to
-            # minimize moving back and forth between real and fourier space
-            is_filter_applied = True if self.filter is None else False
-            if (
-                self.filter is not None
-                and self.filter.array.shape
-                == instrument_config.padded_frequency_grid_in_pixels.shape[0:2]
-            ):
-                # ... apply the filter here if it is the same size as the padded
-                # coordinates
-                is_filter_applied = True
-                image = self.filter(image)
-            image = irfftn(image, s=instrument_config.padded_shape)
-            image = instrument_config.crop_to_shape(image)
-            if self.mask is not None:
-                image = self.mask(image)
-            if is_filter_applied or self.filter is None:
-                return image if get_real else rfftn(image)
-            else:
-                # ... otherwise, apply the filter here and return. assume
-                # the filter is the same size as the non-padded coordinates
-                image = self.filter(rfftn(image))
-                return irfftn(image, s=instrument_config.shape) if get_real else image
+            # ... apply the filter here if it is the same size as the cropped image
+            image = self.filter(rfftn(image))
+            return irfftn(image, s=instrument_config.shape) if get_real else image
 
     def _maybe_postprocess(
         self,
@@ -185,6 +186,7 @@ class ContrastImagingPipeline(AbstractImagingPipeline, strict=True):
         self.filter = filter
         self.mask = mask
 
+    @eqx.filter_jit
     @override
     def render(
         self,
@@ -252,6 +254,7 @@ class IntensityImagingPipeline(AbstractImagingPipeline, strict=True):
         self.filter = filter
         self.mask = mask
 
+    @eqx.filter_jit
     @override
     def render(
         self,
@@ -326,6 +329,7 @@ class ElectronCountingImagingPipeline(AbstractImagingPipeline, strict=True):
         self.filter = filter
         self.mask = mask
 
+    @eqx.filter_jit
     @override
     def render(
         self,
@@ -350,43 +354,29 @@ class ElectronCountingImagingPipeline(AbstractImagingPipeline, strict=True):
         ]
     ):
         if rng_key is None:
-            # Compute the squared wavefunction
-            theory = self.scattering_theory
-            fourier_squared_wavefunction_at_detector_plane = (
-                theory.compute_fourier_squared_wavefunction_at_detector_plane(
-                    self.instrument_config
-                )
+            scattering_key, detector_key = None, None
+        else:
+            scattering_key, detector_key = jax.random.split(rng_key)
+        # Compute the squared wavefunction
+        theory = self.scattering_theory
+        fourier_squared_wavefunction_at_detector_plane = (
+            theory.compute_fourier_squared_wavefunction_at_detector_plane(
+                self.instrument_config, scattering_key
             )
+        )
+        if detector_key is None:
             # ... now measure the expected electron events at the detector
-            fourier_expected_electron_events = (
-                self.detector.compute_expected_electron_events(
-                    fourier_squared_wavefunction_at_detector_plane, self.instrument_config
-                )
-            )
-
-            return self._maybe_postprocess(
-                fourier_expected_electron_events,
-                postprocess=postprocess,
-                get_real=get_real,
+            fourier_electron_events = self.detector.compute_expected_electron_events(
+                fourier_squared_wavefunction_at_detector_plane, self.instrument_config
             )
         else:
-            keys = jax.random.split(rng_key)
-            # Compute the squared wavefunction
-            theory = self.scattering_theory
-            fourier_squared_wavefunction_at_detector_plane = (
-                theory.compute_fourier_squared_wavefunction_at_detector_plane(
-                    self.instrument_config, keys[0]
-                )
-            )
-            # ... now measure the detector readout
-            fourier_detector_readout = self.detector.compute_detector_readout(
-                keys[1],
+            # ... or measure the detector readout
+            fourier_electron_events = self.detector.compute_detector_readout(
+                detector_key,
                 fourier_squared_wavefunction_at_detector_plane,
                 self.instrument_config,
             )
 
-            return self._maybe_postprocess(
-                fourier_detector_readout,
-                postprocess=postprocess,
-                get_real=get_real,
-            )
+        return self._maybe_postprocess(
+            fourier_electron_events, postprocess=postprocess, get_real=get_real
+        )
@@ -4,7 +4,6 @@ Representations of rigid body rotations and translations of 3D coordinate system
 
 from abc import abstractmethod
 from functools import cached_property
-from typing import overload
 from typing_extensions import override
 
 import equinox as eqx
@@ -34,38 +33,34 @@ class AbstractPose(Module, strict=True):
     offset_y_in_angstroms: AbstractVar[Float[Array, ""]]
     offset_z_in_angstroms: AbstractVar[Float[Array, ""]]
 
-    @overload
     def rotate_coordinates(
         self,
-        volume_coordinates: Float[Array, "z_dim y_dim x_dim 3"],
+        volume_coordinates: Float[Array, "... 3"],
         inverse: bool = False,
-    ) -> Float[Array, "z_dim y_dim x_dim 3"]: ...
+    ) -> Float[Array, "... 3"]:
+        """Rotate coordinates from a particular convention.
 
-    @overload
-    def rotate_coordinates(
-        self, volume_coordinates: Float[Array, "size 3"], inverse: bool = False
-    ) -> Float[Array, "size 3"]: ...
-
-    def rotate_coordinates(
-        self,
-        volume_coordinates: Float[Array, "z_dim y_dim x_dim 3"] | Float[Array, "size 3"],
-        inverse: bool = False,
-    ) -> Float[Array, "z_dim y_dim x_dim 3"] | Float[Array, "size 3"]:
-        """Rotate coordinates from a particular convention."""
-        rotation = self.rotation.inverse() if inverse else self.rotation
-        if isinstance(volume_coordinates, Float[Array, "size 3"]):  # type: ignore
-            rotated_volume_coordinates = jax.vmap(rotation.apply)(volume_coordinates)
-        elif isinstance(volume_coordinates, Float[Array, "z_dim y_dim x_dim 3"]):  # type: ignore
-            rotated_volume_coordinates = jax.vmap(jax.vmap(jax.vmap(rotation.apply)))(
-                volume_coordinates
-            )
-        else:
+        Coordinates may have any number of leading dimensions, such as
+        a list of shape `(N, 3)` or a grid of shape `(N1, N2, N3, 3)`.
+        To rotate the same coordinates by a batch of poses, map over the poses
+        with `equinox.filter_vmap`. This lowers to a single batched matmul.
+        """
+        if (
+            volume_coordinates.ndim == 0
+            or volume_coordinates.shape[-1] != 3
+            or not jnp.issubdtype(volume_coordinates.dtype, jnp.floating)
+        ):
             raise ValueError(
-                "Coordinates must be a JAX array either of shape (N, 3) or "
-                f"(N1, N2, N3, 3). Instead, got {volume_coordinates.shape} and type "
-                f"{type(volume_coordinates)}."
+                "Coordinates must be a floating point JAX array with a trailing "
+                f"dimension of size 3. Instead, got {volume_coordinates.shape}, dtype "
+                f"{volume_coordinates.dtype}, and type {type(volume_coordinates)}."
             )
-        return rotated_volume_coordinates
+        # Rotate all coordinates with a single matmul, in the precision of the
+        # coordinates
+        rotation_matrix = self._rotation_matrix.astype(volume_coordinates.dtype)
+        # ... coordinates are row vectors, and the inverse rotation is the transpose
+        rotation_matrix = rotation_matrix if inverse else rotation_matrix.T
+        return volume_coordinates @ rotation_matrix
 
     def compute_shifts(
         self, frequency_grid_in_angstroms: Float[Array, "y_dim x_dim 2"]
@@ -73,8 +68,17 @@ class AbstractPose(Module, strict=True):
         """Compute the phase shifts from the in-plane translation,
         given a frequency grid coordinate system.
         """
-        xy = self.offset_in_angstroms[0:2]
-        return jnp.exp(-1.0j * (2 * jnp.pi * jnp.matmul(frequency_grid_in_angstroms, xy)))
+        dtype = frequency_grid_in_angstroms.dtype
+        # ... the in-plane offset, scaled by 2 pi
+        x = 2 * jnp.pi * self.offset_x_in_angstroms.astype(dtype)
+        y = 2 * jnp.pi * self.offset_y_in_angstroms.astype(dtype)
+        # ... the phase k . r, contracted elementwise over the two grid components
+        phase = (
+            frequency_grid_in_angstroms[..., 0] * x
+            + frequency_grid_in_angstroms[..., 1] * y
+        )
+        # ... exp(-i * phase)
+        return jax.lax.complex(jnp.cos(phase), -jnp.sin(phase))
 
     @cached_property
     def offset_in_angstroms(self) -> Float[Array, "3"]:
@@ -82,12 +86,12 @@ class AbstractPose(Module, strict=True):
         (x, y) coordinates and relative to the configured defocus in the
         out-of-plane z coordinate.
         """
-        return jnp.asarray(
-            (
+        return jnp.stack(
+            [
                 self.offset_x_in_angstroms,
                 self.offset_y_in_angstroms,
                 self.offset_z_in_angstroms,
-            )
+            ]
         )
 
     @cached_property
@@ -96,6 +100,13 @@ class AbstractPose(Module, strict=True):
         """Generate an `SO3` object."""
         raise NotImplementedError
 
+    @cached_property
+    def _rotation_matrix(self) -> Float[Array, "3 3"]:
+        """The matrix of `AbstractPose.rotation`, computed once per pose so that
+        it is shared between calls to `AbstractPose.rotate_coordinates`.
+        """
+        return self.rotation.as_matrix()
+
     @classmethod
     @abstractmethod
     def from_rotation(cls, rotation: SO3):
@@ -172,17 +183,24 @@ class EulerAnglePose(AbstractPose, strict=True):
     def rotation(self) -> SO3:
         """Generate a `SO3` object from a set of Euler angles."""
         phi, theta, psi = self.view_phi, self.view_theta, self.view_psi
-        # Convert to radians.
-        phi = jnp.deg2rad(phi)
-        theta = jnp.deg2rad(theta)
-        psi = jnp.deg2rad(psi)
-        # Get sequence of rotations.
-        R1, R2, R3 = (
-            SO3.from_z_radians(phi),
-            SO3.from_y_radians(theta),
-            SO3.from_z_radians(psi),
+        # Convert to radians and halve the angles with a single constant.
+        degrees_to_half_radians = jnp.pi / 360.0
+        # ... quaternion of the zyz sequence of rotations, equal to
+        # SO3.from_z_radians(psi) @ SO3.from_y_radians(theta) @ SO3.from_z_radians(phi)
+        half_sum = degrees_to_half_radians * (phi + psi)
+        half_difference = degrees_to_half_radians * (phi - psi)
+        half_theta = degrees_to_half_radians * theta
+        cos_half_theta, sin_half_theta = jnp.cos(half_theta), jnp.sin(half_theta)
+        return SO3(
+            jnp.stack(
+                [
+                    cos_half_theta * jnp.cos(half_sum),
+                    sin_half_theta * jnp.sin(half_difference),
+                    -sin_half_theta * jnp.cos(half_difference),
+                    -cos_half_theta * jnp.sin(half_sum),
+                ]
+            )
         )
-        return R3 @ R2 @ R1
 
     @override
     @classmethod
@@ -138,7 +138,7 @@ def _evaluate_2d_real_space_gaussian(
         jnp.exp(
             -jnp.pi
             * b_inverse[None, :, :]
-            * ((grid_x[:, None] - atom_positions.T[0, :]) ** 2)[:, :, None]
+            * ((grid_x[:, None] - atom_positions[:, 0]) ** 2)[:, :, None]
         )
         * a[None, :, :]
         * b_inverse[None, :, :]
@@ -146,12 +146,14 @@ def _evaluate_2d_real_space_gaussian(
     gauss_y = jnp.exp(
         -jnp.pi
         * b_inverse[None, :, :]
-        * ((grid_y[:, None] - atom_positions.T[1, :]) ** 2)[:, :, None]
+        * ((grid_y[:, None] - atom_positions[:, 1]) ** 2)[:, :, None]
     )
 
-    gauss_x = jnp.transpose(gauss_x, (2, 1, 0))
-    gauss_y = jnp.transpose(gauss_y, (2, 0, 1))
-
-    image = 4 * jnp.pi * jnp.sum(jnp.matmul(gauss_y, gauss_x), axis=0)
+    # ... sum over atoms and gaussians in a single matmul
+    image = (
+        4
+        * jnp.pi
+        * (gauss_y.reshape(grid_y.size, -1) @ gauss_x.reshape(grid_x.size, -1).T)
+    )
 
     return image
@@ -1,10 +1,10 @@
 from abc import abstractmethod
+from functools import cached_property
 from typing import Optional
 from typing_extensions import override
 
 import equinox as eqx
 import jax
-import jax.numpy as jnp
 from jaxtyping import Array, Complex, PRNGKeyArray
 
 from .._instrument_config import InstrumentConfig
@@ -82,14 +82,13 @@ class WeakPhaseScatteringTheory(AbstractWeakPhaseScatteringTheory, strict=True):
             )
         )
 
-        if rng_key is not None:
+        if rng_key is not None and self.solvent is not None:
             # Get the potential of the specimen plus the ice
-            if self.solvent is not None:
-                fourier_phase_shifts_at_exit_plane = (
-                    self.solvent.compute_fourier_phase_shifts_with_ice(
-                        rng_key, fourier_phase_shifts_at_exit_plane, instrument_config
-                    )
+            fourier_phase_shifts_at_exit_plane = (
+                self.solvent.compute_fourier_phase_shifts_with_ice(
+                    rng_key, fourier_phase_shifts_at_exit_plane, instrument_config
                 )
+            )
 
         return fourier_phase_shifts_at_exit_plane
 
@@ -101,13 +100,14 @@ class WeakPhaseScatteringTheory(AbstractWeakPhaseScatteringTheory, strict=True):
     ) -> Complex[
         Array, "{instrument_config.padded_y_dim} {instrument_config.padded_x_dim//2+1}"
     ]:
+        defocus_offset = self.structural_ensemble.pose.offset_z_in_angstroms
         fourier_phase_shifts_at_exit_plane = (
             self.compute_fourier_phase_shifts_at_exit_plane(instrument_config, rng_key)
         )
         fourier_contrast_at_detector_plane = self.transfer_theory(
             fourier_phase_shifts_at_exit_plane,
             instrument_config,
-            defocus_offset=self.structural_ensemble.pose.offset_z_in_angstroms,
+            defocus_offset=defocus_offset,
         )
 
         return fourier_contrast_at_detector_plane
@@ -133,6 +133,19 @@ class LinearSuperpositionScatteringTheory(AbstractWeakPhaseScatteringTheory, str
     transfer_theory: ContrastTransferTheory
     solvent: Optional[AbstractIce] = None
 
+    @cached_property
+    def _partitioned_structural_ensemble_batch(
+        self,
+    ) -> tuple[AbstractStructuralEnsemble, AbstractStructuralEnsemble]:
+        # Get the batch
+        ensemble_batch = (
+            self.structural_ensemble_batcher.get_batched_structural_ensemble()
+        )
+        # Setup the map over the pose and conformation. This is cached, so the
+        # module tree of the batch is only walked once per instance
+        to_mapped = jax.tree_util.tree_map(_is_mapped, ensemble_batch, is_leaf=_is_mapped)
+        return eqx.partition(ensemble_batch, to_mapped)
+
     @override
     def compute_fourier_phase_shifts_at_exit_plane(
         self,
@@ -141,50 +154,19 @@ class LinearSuperpositionScatteringTheory(AbstractWeakPhaseScatteringTheory, str
     ) -> Complex[
         Array, "{instrument_config.padded_y_dim} {instrument_config.padded_x_dim//2+1}"
     ]:
-        def compute_image(ensemble_mapped, ensemble_no_mapped, instrument_config):
-            ensemble = eqx.combine(ensemble_mapped, ensemble_no_mapped)
-            fourier_phase_shifts_at_exit_plane = (
-                _compute_phase_shifts_from_integrated_potential(
-                    ensemble, self.potential_integrator, instrument_config
-                )
-            )
-            return fourier_phase_shifts_at_exit_plane
-
-        @eqx.filter_jit
-        def compute_image_superposition(
-            ensemble_mapped, ensemble_no_mapped, instrument_config
-        ):
-            return jnp.sum(
-                jax.lax.map(
-                    lambda x: compute_image(x, ensemble_no_mapped, instrument_config),
-                    ensemble_mapped,
-                ),
-                axis=0,
-            )
+        mapped, no_mapped = self._partitioned_structural_ensemble_batch
 
-        # Get the batch
-        ensemble_batch = (
-            self.structural_ensemble_batcher.get_batched_structural_ensemble()
-        )
-        # Setup vmap over the pose and conformation
-        is_mapped = lambda x: isinstance(
-            x, (AbstractPose, AbstractConformationalVariable)
-        )
-        to_mapped = jax.tree_util.tree_map(is_mapped, ensemble_batch, is_leaf=is_mapped)
-        mapped, no_mapped = eqx.partition(ensemble_batch, to_mapped)
-
-        fourier_phase_shifts_at_exit_plane = compute_image_superposition(
-            mapped, no_mapped, instrument_config
+        fourier_phase_shifts_at_exit_plane = _compute_phase_shifts_superposition(
+            mapped, no_mapped, self.potential_integrator, instrument_config
         )
 
-        if rng_key is not None:
+        if rng_key is not None and self.solvent is not None:
             # Get the potential of the specimen plus the ice
-            if self.solvent is not None:
-                fourier_phase_shifts_at_exit_plane = (
-                    self.solvent.compute_fourier_phase_shifts_with_ice(
-                        rng_key, fourier_phase_shifts_at_exit_plane, instrument_config
-                    )
+            fourier_phase_shifts_at_exit_plane = (
+                self.solvent.compute_fourier_phase_shifts_with_ice(
+                    rng_key, fourier_phase_shifts_at_exit_plane, instrument_config
                 )
+            )
 
         return fourier_phase_shifts_at_exit_plane
 
@@ -196,58 +178,25 @@ class LinearSuperpositionScatteringTheory(AbstractWeakPhaseScatteringTheory, str
     ) -> Complex[
         Array, "{instrument_config.padded_y_dim} {instrument_config.padded_x_dim//2+1}"
     ]:
-        def compute_image(ensemble_mapped, ensemble_no_mapped, instrument_config):
-            ensemble = eqx.combine(ensemble_mapped, ensemble_no_mapped)
-            fourier_phase_shifts_at_exit_plane = (
-                _compute_phase_shifts_from_integrated_potential(
-                    ensemble, self.potential_integrator, instrument_config
-                )
-            )
-            fourier_contrast_at_detector_plane = self.transfer_theory(
-                fourier_phase_shifts_at_exit_plane, instrument_config
-            )
-
-            return fourier_contrast_at_detector_plane
+        mapped, no_mapped = self._partitioned_structural_ensemble_batch
 
-        @eqx.filter_jit
-        def compute_image_superposition(
-            ensemble_mapped, ensemble_no_mapped, instrument_config
-        ):
-            return jnp.sum(
-                jax.lax.map(
-                    lambda x: compute_image(x, ensemble_no_mapped, instrument_config),
-                    ensemble_mapped,
-                ),
-                axis=0,
-            )
-
-        # Get the batch
-        ensemble_batch = (
-            self.structural_ensemble_batcher.get_batched_structural_ensemble()
-        )
-        # Setup vmap over the pose and conformation
-        is_mapped = lambda x: isinstance(
-            x, (AbstractPose, AbstractConformationalVariable)
-        )
-        to_mapped = jax.tree_util.tree_map(is_mapped, ensemble_batch, is_leaf=is_mapped)
-        mapped, no_mapped = eqx.partition(ensemble_batch, to_mapped)
-
-        fourier_contrast_at_detector_plane = compute_image_superposition(
-            mapped, no_mapped, instrument_config
+        fourier_contrast_at_detector_plane = _compute_contrast_superposition(
+            mapped,
+            no_mapped,
+            self.potential_integrator,
+            self.transfer_theory,
+            instrument_config,
         )
 
-        if rng_key is not None:
+        if rng_key is not None and self.solvent is not None:
             # Get the contrast from the ice and add to that of the image batch
-            if self.solvent is not None:
-                fourier_ice_contrast_at_detector_plane = self.transfer_theory(
-                    self.solvent.sample_fourier_phase_shifts_from_ice(
-                        rng_key, instrument_config
-                    ),
-                    instrument_config,
-                )
-                fourier_contrast_at_detector_plane += (
-                    fourier_ice_contrast_at_detector_plane
-                )
+            fourier_ice_contrast_at_detector_plane = self.transfer_theory(
+                self.solvent.sample_fourier_phase_shifts_from_ice(
+                    rng_key, instrument_config
+                ),
+                instrument_config,
+            )
+            fourier_contrast_at_detector_plane += fourier_ice_contrast_at_detector_plane
 
         return fourier_contrast_at_detector_plane
 
@@ -263,6 +212,62 @@ LinearSuperpositionScatteringTheory.__init__.__doc__ = """**Arguments:**
 """
 
 
+def _is_mapped(x):
+    return isinstance(x, (AbstractPose, AbstractConformationalVariable))
+
+
+@eqx.filter_jit
+def _compute_phase_shifts_superposition(
+    ensemble_mapped, ensemble_no_mapped, potential_integrator, instrument_config
+):
+    # Defined at module-level so that the compiled superposition is reused
+    # across calls
+    def compute_image(ensemble_mapped):
+        ensemble = eqx.combine(ensemble_mapped, ensemble_no_mapped)
+        return _compute_phase_shifts_from_integrated_potential(
+            ensemble, potential_integrator, instrument_config
+        )
+
+    return _accumulate_images(compute_image, ensemble_mapped)
+
+
+@eqx.filter_jit
+def _compute_contrast_superposition(
+    ensemble_mapped,
+    ensemble_no_mapped,
+    potential_integrator,
+    transfer_theory,
+    instrument_config,
+):
+    def compute_image(ensemble_mapped):
+        ensemble = eqx.combine(ensemble_mapped, ensemble_no_mapped)
+        fourier_phase_shifts_at_exit_plane = (
+            _compute_phase_shifts_from_integrated_potential(
+                ensemble, potential_integrator, instrument_config
+            )
+        )
+        return transfer_theory(fourier_phase_shifts_at_exit_plane, instrument_config)
+
+    return _accumulate_images(compute_image, ensemble_mapped)
+
+
+def _accumulate_images(compute_image, ensemble_mapped):
+    # Sum images over the batch with a scan, so that only a single image is held
+    # in memory. The scan is initialized with the image of the first element
+    first_ensemble_mapped, other_ensemble_mapped = (
+        jax.tree_util.tree_map(lambda x: x[0], ensemble_mapped),
+        jax.tree_util.tree_map(lambda x: x[1:], ensemble_mapped),
+    )
+
+    def add_image(image_sum, ensemble_mapped):
+        return image_sum + compute_image(ensemble_mapped), None
+
+    image_sum, _ = jax.lax.scan(
+        add_image, compute_image(first_ensemble_mapped), other_ensemble_mapped
+    )
+    return image_sum
+
+
 def _compute_phase_shifts_from_integrated_potential(
     structural_ensemble, potential_integrator, instrument_config
 ):
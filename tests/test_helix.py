@@ -217,3 +217,46 @@ def test_transform_by_rise_and_twist(sample_subunit_mrc_path, pixel_size):
         ),
         atol=1e-1,
     )
+
+
+def test_helical_lattice_dtype():
+    positions, rotations = cs.compute_helical_lattice(
+        jnp.float32(4.0),
+        jnp.float32(20.0),
+        5,
+        jnp.zeros(3, dtype=jnp.float32),
+        n_start=2,
+    )
+    assert positions.dtype == jnp.float32
+    assert rotations.dtype == jnp.float32
+    rotations = cs.compute_helical_lattice_rotations(jnp.float32(20.0), 5, n_start=2)
+    assert rotations.dtype == jnp.float32
+
+
+@pytest.mark.parametrize("n_start, n_subunits_per_start", [(1, 4), (3, 5), (6, 2)])
+def test_helical_lattice_agreement(n_start, n_subunits_per_start):
+    rise, twist = jnp.asarray(21.8), jnp.asarray(29.4)
+    initial_displacement = jnp.asarray([-88.7, 9.75, 2.0])
+    initial_rotation = cs.EulerAnglePose(
+        view_phi=20.0, view_theta=50.0, view_psi=-70.0
+    ).rotation.as_matrix()
+    positions, rotations = cs.compute_helical_lattice(
+        rise,
+        twist,
+        n_subunits_per_start,
+        initial_displacement,
+        initial_rotation,
+        n_start=n_start,
+    )
+    np.testing.assert_allclose(
+        positions,
+        cs.compute_helical_lattice_positions(
+            rise, twist, n_subunits_per_start, initial_displacement, n_start=n_start
+        ),
+    )
+    np.testing.assert_allclose(
+        rotations,
+        cs.compute_helical_lattice_rotations(
+            twist, n_subunits_per_start, initial_rotation, n_start=n_start
+        ),
+    )
@@ -1,3 +1,7 @@
+import inspect
+
+import equinox as eqx
+import jax
 import jax.numpy as jnp
 import numpy as np
 import pytest
@@ -67,3 +71,43 @@ def test_euler_angle_conversion(phi, theta, psi):
             (converted_pose.view_phi, converted_pose.view_theta, converted_pose.view_psi)
         ),
     )
+
+
+def test_batched_pose_rotation():
+    angles = jnp.linspace(-170.0, 170.0, 5)
+    coordinates = jax.random.normal(jax.random.PRNGKey(0), (10, 3))
+
+    @eqx.filter_vmap
+    def make_pose(angle):
+        return cs.EulerAnglePose(view_phi=angle, view_theta=angle / 2, view_psi=-angle)
+
+    poses = make_pose(angles)
+    batched_coordinates = eqx.filter_vmap(
+        lambda pose: pose.rotate_coordinates(coordinates)
+    )(poses)
+    for i, angle in enumerate(angles):
+        pose = cs.EulerAnglePose(view_phi=angle, view_theta=angle / 2, view_psi=-angle)
+        np.testing.assert_allclose(
+            batched_coordinates[i], pose.rotate_coordinates(coordinates), atol=1e-5
+        )
+
+
+@pytest.mark.parametrize("shape", [(10, 3), (4, 5, 3), (2, 3, 4, 3)])
+@pytest.mark.parametrize("inverse", [False, True])
+def test_rotate_coordinates_shapes(shape, inverse):
+    pose = cs.EulerAnglePose(view_phi=30.0, view_theta=40.0, view_psi=50.0)
+    coordinates = jax.random.normal(jax.random.PRNGKey(0), shape)
+    rotation = pose.rotation.inverse() if inverse else pose.rotation
+    expected = jax.vmap(rotation.apply)(coordinates.reshape(-1, 3)).reshape(shape)
+    np.testing.assert_allclose(
+        pose.rotate_coordinates(coordinates, inverse=inverse), expected, atol=1e-12
+    )
+
+
+def test_rotate_integer_coordinates():
+    pose = cs.EulerAnglePose(view_phi=30.0, view_theta=40.0, view_psi=50.0)
+    # Unwrap the runtime type checker installed by the test suite, so that the
+    # check in `rotate_coordinates` itself is tested
+    rotate_coordinates = inspect.unwrap(cs.EulerAnglePose.rotate_coordinates)
+    with pytest.raises(ValueError):
+        rotate_coordinates(pose, jnp.asarray([[1, 0, 0], [0, 2, 0]]))
@@ -0,0 +1,60 @@
+import jax
+import jax.numpy as jnp
+import numpy as np
+import pytest
+
+import cryojax.simulator as cs
+from cryojax.image import irfftn, operators as op, rfftn
+
+
+jax.config.update("jax_enable_x64", True)
+
+
+def postprocess_reference(image, config, filter, mask, get_real):
+    """Apply the filter, crop, and mask one step at a time. The filter is
+    applied before cropping if it is the shape of the padded image, and
+    otherwise after cropping and masking.
+    """
+    is_filter_padded = (
+        filter is not None
+        and filter.array.shape == config.padded_frequency_grid_in_pixels.shape[0:2]
+    )
+    if filter is not None and is_filter_padded:
+        image = filter(image)
+    image = config.crop_to_shape(irfftn(image, s=config.padded_shape))
+    if mask is not None:
+        image = mask(image)
+    if filter is not None and not is_filter_padded:
+        fourier_image = filter(rfftn(image))
+        return irfftn(fourier_image, s=config.shape) if get_real else fourier_image
+    return image if get_real else rfftn(image)
+
+
+@pytest.mark.parametrize("pad_scale", [1.0, 2.0])
+@pytest.mark.parametrize("filter_shape", [None, "padded", "unpadded"])
+@pytest.mark.parametrize("use_mask", [False, True])
+@pytest.mark.parametrize("get_real", [True, False])
+def test_postprocess(pad_scale, filter_shape, use_mask, get_real, theory, pixel_size):
+    config = cs.InstrumentConfig((16, 18), pixel_size, 300.0, pad_scale=pad_scale)
+    keys = jax.random.split(jax.random.PRNGKey(0), 2)
+    # Take the image and filters to be consistent with a real image, so that they
+    # are unchanged by round trips between real and fourier space
+    image = rfftn(jax.random.normal(keys[0], config.padded_shape))
+    if filter_shape is None:
+        filter = None
+    else:
+        frequency_grid = (
+            config.padded_frequency_grid_in_pixels
+            if filter_shape == "padded"
+            else config.frequency_grid_in_pixels
+        )
+        filter = op.CustomFilter(jnp.exp(-20.0 * jnp.sum(frequency_grid**2, axis=-1)))
+    mask = op.CustomMask(jax.random.uniform(keys[1], config.shape)) if use_mask else None
+    pipeline = cs.ContrastImagingPipeline(config, theory, filter=filter, mask=mask)
+
+    np.testing.assert_allclose(
+        pipeline.postprocess(image, get_real=get_real),
+        postprocess_reference(image, config, filter, mask, get_real),
+        atol=1e-10,
+    )
+    assert jnp.iscomplexobj(pipeline.postprocess(image, get_real=get_real)) != get_real